@@ -1,8 +1,6 @@
 import urllib.request
 import json
-import io
-import time
-import os
+import random
 
 def queue_prompt(prompt):
     p = {"prompt": prompt}
@@ -73,7 +71,7 @@ def generate_vayne_concept(positive_prompt, file_prefix):
         "40": {
             "class_type": "KSampler",
             "inputs": {
-                "seed": int(time.time()),
+                "seed": random.randint(0, 2**32 - 1),
                 "steps": 30,
                 "cfg": 7.0,
                 "sampler_name": "dpmpp_2m",
@@ -115,8 +113,6 @@ def generate_vayne_concept(positive_prompt, file_prefix):
     }
     
     queue_prompt(workflow)
-    # Adding a slight delay so seeds evaluate differently
-    time.sleep(1)
 
 # The Prompts for the missing concepts (H, I, J)
 concepts = [